@@ -1,16 +1,27 @@
 
 
 import os
+import re
 import json
 import inspect
 import time
+import atexit
+import functools
 import asyncio
+import hashlib
 import logging
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, asdict, field
+from array import array
+import logging.handlers
+from collections import OrderedDict
+from contextvars import ContextVar
+from uuid import uuid4
+from typing import Dict, Any, Optional, List, Sequence, Tuple
+from dataclasses import dataclass, asdict, field, fields
 from datetime import datetime
 from enum import Enum
 
+import orjson
+
 # Google ADK imports
 from google.adk.agents import Agent, SequentialAgent, LlmAgent
 from google.adk.models.google_llm import Gemini
@@ -25,8 +36,9 @@ os.environ["GOOGLE_API_KEY"] = ""
 
 
 """
-Sequential Multi-Agent Trip Planning System - SYNCHRONOUS VERSION
-Follows day-1b-agent-architectures.ipynb patterns (no async/await/runner)
+Sequential Multi-Agent Trip Planning System - ASYNC VERSION
+Follows day-1b-agent-architectures.ipynb patterns; independent agents
+(flights + accommodation) run concurrently via asyncio.gather
 """
 
 import json
@@ -41,22 +53,95 @@ from enum import Enum
 # OBSERVABILITY & LOGGING
 # =====================================================================
 
-@dataclass
+# Id of the plan_trip request being executed; copied into every asyncio task
+# spawned by the request, so concurrent traces are attributed correctly
+_REQ_ID: ContextVar[str] = ContextVar("trip_request_id")
+
+
+def _format_ns(ts_ns: int) -> str:
+    """Format a time.time_ns() value as an ISO-8601 string (export time only)"""
+    return datetime.fromtimestamp(ts_ns / 1e9).isoformat()
+
+
+def _trace_record(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Export shape of one trace: its field mapping plus an ISO timestamp"""
+    row["timestamp"] = _format_ns(row["ts_ns"])
+    return row
+
+
+@dataclass(slots=True, frozen=True)
 class AgentTrace:
     """Observability trace for agent execution"""
     agent_name: str
-    timestamp: str
     input_query: str
     tools_used: List[str]
     output_length: int
     state_delta: Dict[str, Any]
     error: Optional[str] = None
+    ts_ns: int = field(default_factory=time.time_ns)
+    req_id: str = field(default_factory=lambda: _REQ_ID.get(""))
 
     def to_dict(self):
-        return asdict(self)
-
-
-@dataclass
+        """Shallow field mapping (values are shared, not copied)"""
+        return _trace_record({f.name: getattr(self, f.name) for f in fields(self)})
+
+
+def _new_trace_columns() -> Dict[str, Any]:
+    """One empty column per AgentTrace field; int fields are packed into array('q')"""
+    return {f.name: array("q") if f.type is int else [] for f in fields(AgentTrace)}
+
+
+@dataclass(slots=True)
+class TraceColumns:
+    """Column-oriented (structure-of-arrays) storage for AgentTrace records, keyed by field name"""
+    columns: Dict[str, Any] = field(default_factory=_new_trace_columns)
+
+    def append(self, trace: AgentTrace):
+        """Split a trace into its columns"""
+        for name, column in self.columns.items():
+            column.append(getattr(trace, name))
+
+    def __len__(self) -> int:
+        return len(self.columns["agent_name"])
+
+    def _rows(self):
+        """Field-name -> value dicts, one per stored trace"""
+        names = tuple(self.columns)
+        for values in zip(*self.columns.values()):
+            yield dict(zip(names, values))
+
+    def __iter__(self):
+        """Rebuild AgentTrace rows (for callers that want records)"""
+        for row in self._rows():
+            yield AgentTrace(**row)
+
+    def __getitem__(self, index):
+        """AgentTrace at a row index (a slice returns a list of AgentTrace)"""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return AgentTrace(**{name: column[index] for name, column in self.columns.items()})
+
+    def select(self, req_id: str) -> "TraceColumns":
+        """Traces recorded under one plan_trip request (filtered column-wise)"""
+        rows = [i for i, row_req_id in enumerate(self.columns["req_id"]) if row_req_id == req_id]
+        subset = TraceColumns()
+        for name, column in self.columns.items():
+            subset.columns[name].extend(column[i] for i in rows)
+        return subset
+
+    def trim(self, keep: int):
+        """Drop the oldest rows, keeping the newest `keep`"""
+        excess = len(self) - keep
+        if excess > 0:
+            for column in self.columns.values():
+                del column[:excess]
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Row dicts matching AgentTrace.to_dict(), built column-wise for export"""
+        return [_trace_record(row) for row in self._rows()]
+
+
+@dataclass(slots=True, frozen=True)
 class AgentEvaluation:
     """Evaluation metrics for agent performance"""
     agent_name: str
@@ -65,9 +150,7 @@ class AgentEvaluation:
     response_time_ms: float
     tool_effectiveness: float
     state_consistency: bool
-
-    def to_dict(self):
-        return asdict(self)
+    req_id: str = field(default_factory=lambda: _REQ_ID.get(""))
 
     def __str__(self):
         return f"""
@@ -80,50 +163,150 @@ Agent Evaluation: {self.agent_name}
 """
 
 
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+# Buffering handler installed by _configure_logging (None until then)
+_FILE_BUFFER: Optional[logging.handlers.MemoryHandler] = None
+
+
+def _configure_logging(log_file: str) -> Optional[logging.handlers.MemoryHandler]:
+    """Attach the file + console handlers to the root logger, once per process.
+
+    Returns the buffering handler in front of the log file, or None when the
+    caller had already configured the root logger (their handlers win and no
+    log file is opened). Later calls reuse the first configuration, whatever
+    log_file they pass.
+    """
+    global _FILE_BUFFER
+    if _FILE_BUFFER is not None or logging.getLogger().handlers:
+        return _FILE_BUFFER
+
+    # File records are buffered and written in batches of 64 (or on
+    # flush()/ERROR) instead of one write+flush per log call
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    file_buffer = logging.handlers.MemoryHandler(capacity=64, target=file_handler)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format=LOG_FORMAT,
+        handlers=[
+            file_buffer,
+            logging.StreamHandler()
+        ]
+    )
+    _FILE_BUFFER = file_buffer
+    return file_buffer
+
+
 class ObservabilityManager:
     """Manages logs, traces, and metrics for agents"""
 
-    def __init__(self, log_file: str = "trip_planning_trace.log"):
-        self.traces: List[AgentTrace] = []
+    def __init__(self, log_file: str = "trip_planning_trace.log", max_records: int = 10_000):
+        self.traces = TraceColumns()
         self.evaluations: List[AgentEvaluation] = []
         self.log_file = log_file
 
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler()
-            ]
-        )
+        # Once either store exceeds max_records, its oldest half is dropped
+        # (amortized, so long-running services keep bounded memory)
+        self.max_records = max_records
+
+        self._file_buffer = _configure_logging(log_file)
         self.logger = logging.getLogger(__name__)
 
+    def flush(self):
+        """Write buffered log records to the log file"""
+        if self._file_buffer is not None:
+            self._file_buffer.flush()
+
     def log_trace(self, trace: AgentTrace):
         """Log agent execution trace"""
         self.traces.append(trace)
+        if len(self.traces) > self.max_records:
+            self.traces.trim(self.max_records // 2)
         self.logger.info(f"Trace: {trace.agent_name} - Tools: {trace.tools_used}")
 
     def log_evaluation(self, eval_metric: AgentEvaluation):
         """Log agent evaluation"""
         self.evaluations.append(eval_metric)
+        if len(self.evaluations) > self.max_records:
+            del self.evaluations[:len(self.evaluations) - self.max_records // 2]
         self.logger.info(f"Evaluation: {eval_metric}")
 
-    def export_traces(self, filepath: str = "traces.json"):
-        """Export traces for analysis"""
-        with open(filepath, 'w') as f:
-            json.dump([t.to_dict() for t in self.traces], f, indent=2, default=str)
-
-    def export_evaluations(self, filepath: str = "evaluations.json"):
-        """Export evaluations for analysis"""
-        with open(filepath, 'w') as f:
-            json.dump([e.to_dict() for e in self.evaluations], f, indent=2)
+    def drain(self) -> Tuple[TraceColumns, List[AgentEvaluation]]:
+        """Hand over everything collected so far and start empty stores"""
+        traces, evaluations = self.traces, self.evaluations
+        self.traces = TraceColumns()
+        self.evaluations = []
+        return traces, evaluations
+
+    def export_traces(self, filepath: str = "traces.json", traces: Optional[TraceColumns] = None):
+        """Export traces (default: all held) for analysis, written in one call"""
+        traces = self.traces if traces is None else traces
+        payload = orjson.dumps(
+            traces.to_records(), option=orjson.OPT_INDENT_2, default=str
+        )
+        with open(filepath, 'wb') as f:
+            f.write(payload)
+
+    def export_evaluations(self, filepath: str = "evaluations.json",
+                           evaluations: Optional[Sequence[AgentEvaluation]] = None):
+        """Export evaluations (default: all held); orjson serializes dataclasses natively"""
+        evaluations = self.evaluations if evaluations is None else list(evaluations)
+        payload = orjson.dumps(evaluations, option=orjson.OPT_INDENT_2)
+        with open(filepath, 'wb') as f:
+            f.write(payload)
+
+    def append_traces(self, filepath: str = "traces.jsonl", traces: Optional[TraceColumns] = None):
+        """Append traces (default: all held) as req_id-tagged JSON lines"""
+        traces = self.traces if traces is None else traces
+        _append_jsonl(filepath, traces.to_records())
+
+    def append_evaluations(self, filepath: str = "evaluations.jsonl",
+                           evaluations: Optional[Sequence[AgentEvaluation]] = None):
+        """Append evaluations (default: all held) as req_id-tagged JSON lines"""
+        evaluations = self.evaluations if evaluations is None else evaluations
+        _append_jsonl(filepath, evaluations)
+
+
+def _append_jsonl(filepath: str, records):
+    """Append records as JSON lines in a single write, so requests sharing a file never clobber each other"""
+    payload = b"".join(orjson.dumps(record, default=str) + b"\n" for record in records)
+    with open(filepath, 'ab') as f:
+        f.write(payload)
+
+
+@functools.lru_cache(maxsize=1)
+def get_observability() -> ObservabilityManager:
+    """Process-wide ObservabilityManager, created on first use.
+
+    Every planner and agent logs here and traces are told apart by req_id.
+    Creating it lazily keeps imports free of logging side effects, so callers
+    can configure the root logger first.
+    """
+    return ObservabilityManager()
 
 
 # =====================================================================
 # SHARED STATE MANAGEMENT (Core Sequential Architecture)
 # =====================================================================
 
-@dataclass
+# Agent output fields that feed the next agent's context, with their labels
+CONTEXT_SECTIONS = (
+    ("research_findings", "Research Findings"),
+    ("flight_options", "Flight Options"),
+    ("accommodation_options", "Accommodation Options"),
+    ("itinerary", "Itinerary"),
+)
+_CONTEXT_LABELS = dict(CONTEXT_SECTIONS)
+_CONTEXT_ORDER = {name: i for i, (name, _) in enumerate(CONTEXT_SECTIONS)}
+
+# Every agent output field, in pipeline order
+OUTPUT_FIELDS = tuple(name for name, _ in CONTEXT_SECTIONS) + ("budget_summary",)
+
+
+@dataclass(slots=True)
 class TripPlanningState:
     """Shared state object passed through sequential agents"""
     destination: Optional[str] = None
@@ -136,26 +319,80 @@ class TripPlanningState:
     itinerary: Optional[str] = None
     budget_summary: Optional[str] = None
 
-    # Metadata
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    # Metadata (time.time_ns(); exposed only as created_at/updated_at ISO strings)
+    created_ns: int = field(default_factory=time.time_ns, metadata={"skip": True})
+    updated_ns: int = field(default_factory=time.time_ns, metadata={"skip": True})
     completed_agents: List[str] = field(default_factory=list)
 
-    def update(self, agent_name: str, **kwargs):
-        """Update state with agent output"""
+    # Agent context, grown by update() instead of rebuilt per agent
+    _context_cache: str = field(default="", init=False, repr=False, compare=False,
+                                metadata={"skip": True})
+
+    def __post_init__(self):
+        self._context_cache = self._build_context()
+
+    def update(self, agent_name: str, ts_ns: Optional[int] = None, **kwargs):
+        """Update state with agent output (ts_ns reuses the agent's trace timestamp)"""
+        rebuild = False
         for key, value in kwargs.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
-        self.updated_at = datetime.now().isoformat()
+            if not hasattr(self, key):
+                continue
+            if key in _CONTEXT_LABELS and getattr(self, key) is None and not self._has_later_section(key):
+                # Appending keeps CONTEXT_SECTIONS order only when no later
+                # section is already present (same-wave agents finish unordered)
+                if value:
+                    self._append_context(f"{_CONTEXT_LABELS[key]}:\n{value}")
+            elif key in _CONTEXT_LABELS or key in ("destination", "user_preferences"):
+                # Out-of-order section or overwriting emitted context: rebuild
+                rebuild = True
+            setattr(self, key, value)
+        if rebuild:
+            self._context_cache = self._build_context()
+        self.updated_ns = ts_ns if ts_ns is not None else time.time_ns()
         if agent_name not in self.completed_agents:
             self.completed_agents.append(agent_name)
 
     def to_dict(self) -> Dict:
-        """Convert state to dictionary"""
-        return asdict(self)
+        """Convert state to dictionary (internal caches excluded).
+
+        Shallow: values are references to the state's own strings, dict and
+        list, so callers must not mutate them. Use deep_dict() for a copy.
+        """
+        data = {f.name: getattr(self, f.name) for f in fields(self) if not f.metadata.get("skip")}
+        data["created_at"] = _format_ns(self.created_ns)
+        data["updated_at"] = _format_ns(self.updated_ns)
+        return data
+
+    def deep_dict(self) -> Dict:
+        """Like to_dict(), but with containers deep-copied"""
+        data = asdict(self)
+        for f in fields(self):
+            if f.metadata.get("skip"):
+                del data[f.name]
+        data["created_at"] = _format_ns(self.created_ns)
+        data["updated_at"] = _format_ns(self.updated_ns)
+        return data
 
     def get_context_for_agent(self) -> str:
-        """Generate context string for next agent in sequence"""
+        """Context string for next agent in sequence (maintained by update())"""
+        return self._context_cache
+
+    def iter_outputs(self):
+        """Yield the populated agent outputs (by reference) in pipeline order"""
+        for name in OUTPUT_FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                yield value
+
+    def _has_later_section(self, key: str) -> bool:
+        """Whether a section after `key` in CONTEXT_SECTIONS is already populated"""
+        return any(getattr(self, name) for name, _ in CONTEXT_SECTIONS[_CONTEXT_ORDER[key] + 1:])
+
+    def _append_context(self, part: str):
+        self._context_cache = f"{self._context_cache}\n\n{part}" if self._context_cache else part
+
+    def _build_context(self) -> str:
+        """Build the full context string from scratch"""
         context_parts = []
 
         if self.destination:
@@ -164,38 +401,125 @@ class TripPlanningState:
         if self.user_preferences:
             context_parts.append(f"Preferences: {json.dumps(self.user_preferences)}")
 
-        if self.research_findings:
-            context_parts.append(f"Research Findings:\n{self.research_findings}")
-
-        if self.flight_options:
-            context_parts.append(f"Flight Options:\n{self.flight_options}")
-
-        if self.accommodation_options:
-            context_parts.append(f"Accommodation Options:\n{self.accommodation_options}")
-
-        if self.itinerary:
-            context_parts.append(f"Itinerary:\n{self.itinerary}")
+        for name, label in CONTEXT_SECTIONS:
+            value = getattr(self, name)
+            if value:
+                context_parts.append(f"{label}:\n{value}")
 
         return "\n\n".join(context_parts)
 
 
 # =====================================================================
-# SEQUENTIAL AGENTS (Synchronous - No async/await)
+# RESULT CACHE (repeat queries skip agent recomputation)
 # =====================================================================
 
-class Agent1_ResearchDestination:
-    """Agent 1: Research destination - FIRST in sequence"""
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "tripplanner", "agent_results.json")
+
+# Part of every cache key; bump when agent templates, prompts or models
+# change so outputs produced by the old version are never served
+CACHE_SCHEMA_VERSION = 1
+
+
+class AgentResultCache:
+    """LRU cache of agent outputs keyed by (agent, destination, preferences), with per-get TTLs"""
+
+    def __init__(self, maxsize: int = 512, path: Optional[str] = DEFAULT_CACHE_PATH):
+        self.maxsize = maxsize
+        self.path = path
+        # key -> (stored_at epoch seconds, output)
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        if path:
+            self.load()
 
     @staticmethod
-    def execute(state: TripPlanningState, observability_mgr: ObservabilityManager) -> str:
-        """Execute research synchronously"""
+    def make_key(agent_name: str, destination: str, preferences: Dict[str, Any]) -> str:
+        """Stable digest of the schema version and agent inputs (preferences canonicalized)"""
+        canonical = json.dumps(preferences, sort_keys=True, default=str)
+        payload = f"v{CACHE_SCHEMA_VERSION}\0{agent_name}\0{destination}\0{canonical}".encode()
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def get(self, key: str, ttl_s: float) -> Optional[str]:
+        """Return cached output younger than ttl_s and mark it most recently used"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.time() - stored_at > ttl_s:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: str):
+        """Store output, evicting the least recently used entry when full"""
+        self._entries[key] = (time.time(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def load(self):
+        """Load entries persisted by a previous run; missing/corrupt files start empty"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                rows = json.load(f)
+            entries = OrderedDict(
+                (str(key), (float(stored_at), str(value))) for key, stored_at, value in rows
+            )
+        except (OSError, ValueError, TypeError):
+            entries = OrderedDict()
+        while len(entries) > self.maxsize:
+            entries.popitem(last=False)
+        self._entries = entries
+
+    def save(self):
+        """Persist entries (as JSON [key, stored_at, output] rows) so later runs start warm"""
+        if not self.path:
+            return
+        tmp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump([[key, stored_at, value] for key, (stored_at, value) in self._entries.items()], f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            # Runs from atexit: a read-only or missing $HOME must not crash shutdown
+            logging.getLogger(__name__).warning(f"Could not save agent result cache to {self.path}: {e}")
 
-        print("\n[Agent1] Researching destination...")
 
-        destination = state.destination
+@functools.lru_cache(maxsize=1)
+def get_result_cache() -> AgentResultCache:
+    """Process-wide result cache, loaded on first use and saved once at exit.
+
+    Sharing one instance keeps planners from overwriting each other's
+    entries on disk.
+    """
+    cache = AgentResultCache()
+    atexit.register(cache.save)
+    return cache
+
+
+async def _cached_compute(cache: Optional[AgentResultCache], agent: type, destination: str,
+                          preferences: Dict[str, Any]) -> Tuple[str, bool]:
+    """Run agent._compute through the cache (honouring agent.cache_ttl_s); returns (output, cache_hit)"""
+    if cache is None:
+        return await agent._compute(destination, preferences), False
+
+    key = AgentResultCache.make_key(agent.__name__, destination, preferences)
+    output = cache.get(key, agent.cache_ttl_s)
+    if output is not None:
+        return output, True
+
+    output = await agent._compute(destination, preferences)
+    cache.put(key, output)
+    return output, False
+
+
+# =====================================================================
+# AGENT OUTPUT TEMPLATES (built once at import, not per call)
+# =====================================================================
 
-        # Synchronous research execution (simulated with structured output)
-        research_output = f"""
+# Only Agent1's output interpolates the destination; the rest are constant
+_AGENT1_TEMPLATE = """
 DESTINATION RESEARCH: {destination}
 
 Climate & Weather:
@@ -223,37 +547,7 @@ Cultural Insights:
 Best Time to Visit: April-May or September-October
 """
 
-        # Log trace
-        trace = AgentTrace(
-            agent_name="Agent1_ResearchDestination",
-            timestamp=datetime.now().isoformat(),
-            input_query=f"Research {destination}",
-            tools_used=["search", "data_aggregation"],
-            output_length=len(research_output),
-            state_delta={"research_findings": "populated"}
-        )
-        observability_mgr.log_trace(trace)
-
-        # Update state
-        state.update("Agent1_ResearchDestination", research_findings=research_output)
-
-        print(f"✅ Agent1 completed. Research findings added to state.")
-        return research_output
-
-
-class Agent2_FindFlights:
-    """Agent 2: Find flights - SECOND in sequence (uses Agent1 output)"""
-
-    @staticmethod
-    def execute(state: TripPlanningState, observability_mgr: ObservabilityManager) -> str:
-        """Execute flight search using research context"""
-
-        print("\n[Agent2] Searching for flights (using research context)...")
-
-        # Access prior agent's context
-        context = state.get_context_for_agent()
-
-        flight_output = f"""
+_AGENT2_OUTPUT = """
 FLIGHT OPTIONS: Research-based recommendations
 
 Option 1: Direct Flight via Airlines (Premium)
@@ -285,34 +579,7 @@ Based on research (best visit: Spring/Fall), recommend:
 - Prefer Option 1 (direct) or Option 2 (good balance)
 """
 
-        trace = AgentTrace(
-            agent_name="Agent2_FindFlights",
-            timestamp=datetime.now().isoformat(),
-            input_query=f"Find flights using research",
-            tools_used=["flight_search", "price_comparison"],
-            output_length=len(flight_output),
-            state_delta={"flight_options": "populated"}
-        )
-        observability_mgr.log_trace(trace)
-
-        state.update("Agent2_FindFlights", flight_options=flight_output)
-
-        print(f"✅ Agent2 completed. Flight options added to state.")
-        return flight_output
-
-
-class Agent3_FindAccommodation:
-    """Agent 3: Find accommodation - THIRD in sequence (uses Agent1 & Agent2)"""
-
-    @staticmethod
-    def execute(state: TripPlanningState, observability_mgr: ObservabilityManager) -> str:
-        """Execute accommodation search using full prior context"""
-
-        print("\n[Agent3] Finding accommodations (using research & flights)...")
-
-        context = state.get_context_for_agent()
-
-        accommodation_output = f"""
+_AGENT3_OUTPUT = """
 ACCOMMODATION OPTIONS: Based on research, flights, and preferences
 
 Option 1: Luxury Hotel (5-star)
@@ -350,34 +617,7 @@ Recommendation based on your 5-day stay and moderate budget:
 - Total accommodation: $380-550
 """
 
-        trace = AgentTrace(
-            agent_name="Agent3_FindAccommodation",
-            timestamp=datetime.now().isoformat(),
-            input_query="Find accommodations",
-            tools_used=["hotel_search", "airbnb_search", "reviews"],
-            output_length=len(accommodation_output),
-            state_delta={"accommodation_options": "populated"}
-        )
-        observability_mgr.log_trace(trace)
-
-        state.update("Agent3_FindAccommodation", accommodation_options=accommodation_output)
-
-        print(f"✅ Agent3 completed. Accommodation options added to state.")
-        return accommodation_output
-
-
-class Agent4_CreateItinerary:
-    """Agent 4: Create itinerary - FOURTH in sequence (uses all prior)"""
-
-    @staticmethod
-    def execute(state: TripPlanningState, observability_mgr: ObservabilityManager) -> str:
-        """Execute itinerary planning using complete context"""
-
-        print("\n[Agent4] Creating detailed itinerary (using all prior context)...")
-
-        context = state.get_context_for_agent()
-
-        itinerary_output = f"""
+_AGENT4_OUTPUT = """
 DETAILED 5-DAY ITINERARY
 
 DAY 1: Arrival & Orientation
@@ -429,34 +669,7 @@ Budget Breakdown:
 - TOTAL: ~$2000 per person
 """
 
-        trace = AgentTrace(
-            agent_name="Agent4_CreateItinerary",
-            timestamp=datetime.now().isoformat(),
-            input_query="Create itinerary",
-            tools_used=["calendar", "map", "recommendations"],
-            output_length=len(itinerary_output),
-            state_delta={"itinerary": "populated"}
-        )
-        observability_mgr.log_trace(trace)
-
-        state.update("Agent4_CreateItinerary", itinerary=itinerary_output)
-
-        print(f"✅ Agent4 completed. Itinerary added to state.")
-        return itinerary_output
-
-
-class Agent5_BudgetAnalysis:
-    """Agent 5: Budget analysis - FIFTH in sequence (uses complete context)"""
-
-    @staticmethod
-    def execute(state: TripPlanningState, observability_mgr: ObservabilityManager) -> str:
-        """Execute budget analysis with complete context"""
-
-        print("\n[Agent5] Analyzing budget (using complete context)...")
-
-        context = state.get_context_for_agent()
-
-        budget_output = f"""
+_AGENT5_OUTPUT = """
 COMPREHENSIVE BUDGET ANALYSIS
 
 DETAILED COST BREAKDOWN:
@@ -515,126 +728,450 @@ Your trip fits the "Comfort" category at ~$2,500 with good balance
 of experiences and cost management.
 """
 
+
+# =====================================================================
+# SEQUENTIAL AGENTS (async execute - awaited by the orchestrator)
+# =====================================================================
+
+class Agent1_ResearchDestination:
+    """Agent 1: Research destination - FIRST in sequence"""
+
+    depends_on = ()
+    keywords = ("research", "weather", "visa", "attraction")
+    cache_ttl_s = 3 * 24 * 3600  # destination research changes over days
+
+    @staticmethod
+    async def _compute(destination: str, preferences: Dict[str, Any]) -> str:
+        """Research findings for a destination (pure; cached by AgentResultCache)"""
+        # Research execution (simulated with structured output; the real
+        # LLM call is awaited here)
+        return _AGENT1_TEMPLATE.format_map({"destination": destination})
+
+    @staticmethod
+    async def execute(state: TripPlanningState, cache: Optional[AgentResultCache] = None) -> str:
+        """Execute research (awaitable LLM call site)"""
+
+        print("\n[Agent1] Researching destination...")
+
+        destination = state.destination
+
+        research_output, cache_hit = await _cached_compute(
+            cache, Agent1_ResearchDestination, destination, state.user_preferences
+        )
+
+        ts_ns = time.time_ns()
+
+        # Log trace
+        trace = AgentTrace(
+            agent_name="Agent1_ResearchDestination",
+            ts_ns=ts_ns,
+            input_query=f"Research {destination}",
+            tools_used=["cache"] if cache_hit else ["search", "data_aggregation"],
+            output_length=len(research_output),
+            state_delta={"research_findings": "populated"}
+        )
+        get_observability().log_trace(trace)
+
+        # Update state
+        state.update("Agent1_ResearchDestination", ts_ns=ts_ns, research_findings=research_output)
+
+        print(f"✅ Agent1 completed. Research findings added to state.")
+        return research_output
+
+
+class Agent2_FindFlights:
+    """Agent 2: Find flights - runs alongside Agent3 (uses Agent1 output)"""
+
+    depends_on = (Agent1_ResearchDestination,)
+    keywords = ("flight", "fly", "airline", "airfare")
+    cache_ttl_s = 3600  # fares move hourly
+
+    @staticmethod
+    async def _compute(destination: str, preferences: Dict[str, Any]) -> str:
+        """Flight options for a destination (pure; cached by AgentResultCache)"""
+        return _AGENT2_OUTPUT
+
+    @staticmethod
+    async def execute(state: TripPlanningState, cache: Optional[AgentResultCache] = None) -> str:
+        """Execute flight search using research context"""
+
+        print("\n[Agent2] Searching for flights (using research context)...")
+
+        # Access prior agent's context
+        context = state.get_context_for_agent()
+
+        flight_output, cache_hit = await _cached_compute(
+            cache, Agent2_FindFlights, state.destination, state.user_preferences
+        )
+
+        ts_ns = time.time_ns()
+
+        trace = AgentTrace(
+            agent_name="Agent2_FindFlights",
+            ts_ns=ts_ns,
+            input_query=f"Find flights using research",
+            tools_used=["cache"] if cache_hit else ["flight_search", "price_comparison"],
+            output_length=len(flight_output),
+            state_delta={"flight_options": "populated"}
+        )
+        get_observability().log_trace(trace)
+
+        state.update("Agent2_FindFlights", ts_ns=ts_ns, flight_options=flight_output)
+
+        print(f"✅ Agent2 completed. Flight options added to state.")
+        return flight_output
+
+
+class Agent3_FindAccommodation:
+    """Agent 3: Find accommodation - runs alongside Agent2 (uses Agent1 output)"""
+
+    depends_on = (Agent1_ResearchDestination,)
+    keywords = ("hotel", "accommodation", "airbnb", "lodging")
+    cache_ttl_s = 6 * 3600  # room rates and availability
+
+    @staticmethod
+    async def _compute(destination: str, preferences: Dict[str, Any]) -> str:
+        """Accommodation options for a destination (pure; cached by AgentResultCache)"""
+        return _AGENT3_OUTPUT
+
+    @staticmethod
+    async def execute(state: TripPlanningState, cache: Optional[AgentResultCache] = None) -> str:
+        """Execute accommodation search using research context"""
+
+        print("\n[Agent3] Finding accommodations (using research context)...")
+
+        context = state.get_context_for_agent()
+
+        accommodation_output, cache_hit = await _cached_compute(
+            cache, Agent3_FindAccommodation, state.destination, state.user_preferences
+        )
+
+        ts_ns = time.time_ns()
+
+        trace = AgentTrace(
+            agent_name="Agent3_FindAccommodation",
+            ts_ns=ts_ns,
+            input_query="Find accommodations",
+            tools_used=["cache"] if cache_hit else ["hotel_search", "airbnb_search", "reviews"],
+            output_length=len(accommodation_output),
+            state_delta={"accommodation_options": "populated"}
+        )
+        get_observability().log_trace(trace)
+
+        state.update("Agent3_FindAccommodation", ts_ns=ts_ns, accommodation_options=accommodation_output)
+
+        print(f"✅ Agent3 completed. Accommodation options added to state.")
+        return accommodation_output
+
+
+class Agent4_CreateItinerary:
+    """Agent 4: Create itinerary - FOURTH in sequence (uses all prior)"""
+
+    depends_on = (Agent2_FindFlights, Agent3_FindAccommodation)
+    keywords = ("itinerary", "schedule", "day-by-day")
+    cache_ttl_s = 24 * 3600
+
+    @staticmethod
+    async def _compute(destination: str, preferences: Dict[str, Any]) -> str:
+        """Itinerary for a destination (pure; cached by AgentResultCache)"""
+        return _AGENT4_OUTPUT
+
+    @staticmethod
+    async def execute(state: TripPlanningState, cache: Optional[AgentResultCache] = None) -> str:
+        """Execute itinerary planning using complete context"""
+
+        print("\n[Agent4] Creating detailed itinerary (using all prior context)...")
+
+        context = state.get_context_for_agent()
+
+        itinerary_output, cache_hit = await _cached_compute(
+            cache, Agent4_CreateItinerary, state.destination, state.user_preferences
+        )
+
+        ts_ns = time.time_ns()
+
+        trace = AgentTrace(
+            agent_name="Agent4_CreateItinerary",
+            ts_ns=ts_ns,
+            input_query="Create itinerary",
+            tools_used=["cache"] if cache_hit else ["calendar", "map", "recommendations"],
+            output_length=len(itinerary_output),
+            state_delta={"itinerary": "populated"}
+        )
+        get_observability().log_trace(trace)
+
+        state.update("Agent4_CreateItinerary", ts_ns=ts_ns, itinerary=itinerary_output)
+
+        print(f"✅ Agent4 completed. Itinerary added to state.")
+        return itinerary_output
+
+
+class Agent5_BudgetAnalysis:
+    """Agent 5: Budget analysis - FIFTH in sequence (uses complete context)"""
+
+    depends_on = (Agent4_CreateItinerary,)
+    keywords = ("budget", "cost")
+    cache_ttl_s = 3600  # built from fares and rates
+
+    @staticmethod
+    async def _compute(destination: str, preferences: Dict[str, Any]) -> str:
+        """Budget analysis for a destination (pure; cached by AgentResultCache)"""
+        return _AGENT5_OUTPUT
+
+    @staticmethod
+    async def execute(state: TripPlanningState, cache: Optional[AgentResultCache] = None) -> str:
+        """Execute budget analysis with complete context"""
+
+        print("\n[Agent5] Analyzing budget (using complete context)...")
+
+        context = state.get_context_for_agent()
+
+        budget_output, cache_hit = await _cached_compute(
+            cache, Agent5_BudgetAnalysis, state.destination, state.user_preferences
+        )
+
+        ts_ns = time.time_ns()
+
         trace = AgentTrace(
             agent_name="Agent5_BudgetAnalysis",
-            timestamp=datetime.now().isoformat(),
+            ts_ns=ts_ns,
             input_query="Analyze budget",
-            tools_used=["cost_calculator", "price_database"],
+            tools_used=["cache"] if cache_hit else ["cost_calculator", "price_database"],
             output_length=len(budget_output),
             state_delta={"budget_summary": "populated"}
         )
-        observability_mgr.log_trace(trace)
+        get_observability().log_trace(trace)
 
-        state.update("Agent5_BudgetAnalysis", budget_summary=budget_output)
+        state.update("Agent5_BudgetAnalysis", ts_ns=ts_ns, budget_summary=budget_output)
 
         print(f"✅ Agent5 completed. Budget analysis added to state.")
         return budget_output
 
 
+# =====================================================================
+# JIT PLANNER (query -> waves of agents)
+# =====================================================================
+
+class JITPlanner:
+    """
+    Compiles a trip request into an execution plan of agent "waves".
+
+    Only the agents the query or preferences["services"] ask for (plus their
+    dependencies) are scheduled. Agents within a wave have no dependencies on each other and
+    are run concurrently; waves run in order.
+    """
+
+    AGENTS = (
+        Agent1_ResearchDestination,
+        Agent2_FindFlights,
+        Agent3_FindAccommodation,
+        Agent4_CreateItinerary,
+        Agent5_BudgetAnalysis,
+    )
+
+    @classmethod
+    def compile(cls, query: Optional[str] = None,
+                preferences: Optional[Dict[str, Any]] = None) -> List[List[type]]:
+        """Return topologically ordered waves of agent classes for the request"""
+        targets = cls._select_targets(query, preferences)
+
+        # Pull in transitive dependencies of every requested agent
+        required = set()
+        pending = list(targets)
+        while pending:
+            agent = pending.pop()
+            if agent not in required:
+                required.add(agent)
+                pending.extend(agent.depends_on)
+
+        # Each agent's wave is one past the deepest wave it depends on; resolved
+        # recursively so AGENTS need not be listed in dependency order
+        depth: Dict[type, int] = {}
+
+        def wave_of(agent: type) -> int:
+            if agent not in depth:
+                depth[agent] = 1 + max((wave_of(d) for d in agent.depends_on), default=-1)
+            return depth[agent]
+
+        for agent in required:
+            wave_of(agent)
+
+        # Within a wave, keep AGENTS order (unlisted dependencies go last)
+        position = {agent: i for i, agent in enumerate(cls.AGENTS)}
+        waves: List[List[type]] = [[] for _ in range(max(depth.values()) + 1)]
+        for agent in sorted(depth, key=lambda a: (position.get(a, len(position)), a.__name__)):
+            waves[depth[agent]].append(agent)
+        return waves
+
+    @classmethod
+    def _select_targets(cls, query: Optional[str],
+                        preferences: Optional[Dict[str, Any]]) -> List[type]:
+        """Agents whose keywords appear as words in the request; full plan if none do"""
+        services = (preferences or {}).get("services") or []
+        if isinstance(services, str):
+            services = [services]
+        words = cls._words(" ".join([query or "", *map(str, services)]))
+        matched = [a for a in cls.AGENTS if words.intersection(a.keywords)]
+        return matched or list(cls.AGENTS)
+
+    @staticmethod
+    def _words(text: str) -> set:
+        """Lower-cased words in text, plus their singular form ("flights" -> "flight")"""
+        words = set(re.findall(r"[a-z-]+", text.lower()))
+        return words | {w[:-1] for w in words if len(w) > 3 and w.endswith("s")}
+
+
 # =====================================================================
 # SEQUENTIAL ORCHESTRATOR (Main Sequential Architecture)
 # =====================================================================
 
+class TripResult(dict):
+    """
+    plan_trip results. "response" holds the agent outputs as a list; the
+    joined text is an attribute, result.response_text, built on first access
+    (it is not a dict key).
+    """
+
+    @functools.cached_property
+    def response_text(self) -> str:
+        return "\n\n".join(self["response"])
+
+
 class SequentialTripPlanner:
     """
-    Synchronous Sequential Agent Orchestrator following day-1b architecture.
+    Async Sequential Agent Orchestrator following day-1b architecture.
 
-    Pattern (SYNCHRONOUS):
-    Agent1 (Research) -> Agent2 (Flights) -> Agent3 (Hotels) 
+    Pattern (full plan, concurrent where independent):
+    Agent1 (Research) -> [Agent2 (Flights) || Agent3 (Hotels)]
     -> Agent4 (Itinerary) -> Agent5 (Budget)
 
-    Each agent receives full context from all previous agents via shared state.
-    No async/await or runner code - pure synchronous execution.
+    JITPlanner compiles each request into waves of only the agents it needs
+    (e.g. a flights-only query runs Agent1 -> Agent2). Each agent receives
+    full context from all previously completed agents via shared state;
+    agents in the same wave are dispatched together with asyncio.gather.
     """
 
-    def __init__(self):
-        self.observability = ObservabilityManager()
+    def __init__(self, cache_enabled: bool = True):
+        # Shared across planners so concurrent requests land in one trace store
+        self.observability = get_observability()
         self.state: Optional[TripPlanningState] = None
 
-    def plan_trip(self, destination: str, preferences: Dict[str, Any]) -> Dict[str, Any]:
+        # Agent outputs are cached by (destination, preferences) in the shared
+        # process cache, written back to disk at interpreter exit; pass
+        # cache_enabled=False to opt out
+        self.cache: Optional[AgentResultCache] = get_result_cache() if cache_enabled else None
+
+    def plan_trip(self, destination: str, preferences: Dict[str, Any],
+                  query: Optional[str] = None) -> TripResult:
+        """Synchronous wrapper around plan_trip_async for callers without a running event loop"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.plan_trip_async(destination, preferences, query))
+        # Checked before building the coroutine so nothing is left un-awaited
+        raise RuntimeError(
+            "plan_trip() cannot be called from a running event loop (e.g. Jupyter); "
+            "use `await planner.plan_trip_async(...)` instead"
+        )
+
+    async def plan_trip_async(self, destination: str, preferences: Dict[str, Any],
+                              query: Optional[str] = None) -> TripResult:
         """
-        Execute sequential trip planning workflow SYNCHRONOUSLY.
+        Execute sequential trip planning workflow.
 
         Flow:
         1. Initialize shared state
-        2. Execute Agent1 (Research)
-        3. Execute Agent2 (Flights) with Agent1 context
-        4. Execute Agent3 (Hotels) with Agent1+Agent2 context
-        5. Execute Agent4 (Itinerary) with all prior context
-        6. Execute Agent5 (Budget) with complete context
-        7. Return organized results
+        2. Compile the query into waves of required agents (all five if no query)
+        3. Execute each wave concurrently, in order
+        4. Evaluate all executed agents in one batch
+        5. Return organized results
+
+        Traces from this call are tagged with a fresh request id (via the
+        _REQ_ID context variable) in the process-wide ObservabilityManager.
         """
+        req_id = uuid4().hex
+        token = _REQ_ID.set(req_id)
+        try:
+            return await self._execute_plan(destination, preferences, query, req_id)
+        finally:
+            _REQ_ID.reset(token)
+
+    async def _execute_plan(self, destination: str, preferences: Dict[str, Any],
+                            query: Optional[str], req_id: str) -> TripResult:
+        """Run the compiled plan under the current request id"""
 
-        # STEP 1: Initialize shared state
-        self.state = TripPlanningState(
+        # STEP 1: Initialize shared state (local, so overlapping runs on one
+        # planner never see each other's outputs)
+        state = TripPlanningState(
             destination=destination,
             user_preferences=preferences
         )
 
+        # STEP 2: Compile execution plan
+        plan = JITPlanner.compile(query, preferences)
+        architecture = " → ".join(
+            " ∥ ".join(agent.__name__.split("_")[0] for agent in wave) for wave in plan
+        )
+
         print(f"\n🌍 Starting SEQUENTIAL Trip Planning: {destination}")
         print("=" * 70)
-        print(f"[INFO] Synchronous Sequential Pipeline (No async/await)")
-        print(f"[INFO] Architecture: Agent1 → Agent2 → Agent3 → Agent4 → Agent5")
+        print(f"[INFO] Async Sequential Pipeline (independent agents via asyncio.gather)")
+        print(f"[INFO] Architecture: {architecture}")
 
         try:
-            # STEP 2: Execute Agent1 (Research)
-            print("\n[STEP 1/5] Agent1: Research Destination")
-            agent1_output = Agent1_ResearchDestination.execute(
-                self.state, self.observability
-            )
-
-            # STEP 3: Execute Agent2 (Flights) with Agent1 context
-            print("\n[STEP 2/5] Agent2: Find Flights (sees Agent1 research)")
-            agent2_output = Agent2_FindFlights.execute(
-                self.state, self.observability
-            )
-
-            # STEP 4: Execute Agent3 (Hotels) with Agent1+Agent2 context
-            print("\n[STEP 3/5] Agent3: Find Hotels (sees Agent1+Agent2 context)")
-            agent3_output = Agent3_FindAccommodation.execute(
-                self.state, self.observability
-            )
-
-            # STEP 5: Execute Agent4 (Itinerary) with all prior context
-            print("\n[STEP 4/5] Agent4: Create Itinerary (sees all prior context)")
-            agent4_output = Agent4_CreateItinerary.execute(
-                self.state, self.observability
-            )
-
-            # STEP 6: Execute Agent5 (Budget) with complete context
-            print("\n[STEP 5/5] Agent5: Budget Analysis (sees complete context)")
-            agent5_output = Agent5_BudgetAnalysis.execute(
-                self.state, self.observability
-            )
+            # STEP 3: Execute each wave; agents in a wave only see prior waves
+            outputs: Dict[type, str] = {}
+            for step, wave in enumerate(plan, start=1):
+                print(f"\n[STEP {step}/{len(plan)}] " + " + ".join(a.__name__ for a in wave))
+                wave_outputs = await asyncio.gather(
+                    *[agent.execute(state, self.cache) for agent in wave]
+                )
+                outputs.update(zip(wave, wave_outputs))
+
+                # Agents in a wave may finish in any order; record them in
+                # plan order so completed_agents is deterministic
+                wave_names = [agent.__name__ for agent in wave]
+                state.completed_agents[:] = (
+                    [name for name in state.completed_agents if name not in wave_names] + wave_names
+                )
 
             print("\n" + "=" * 70)
             print(f"\n✅ Sequential pipeline completed successfully!")
-            print(f"Agents executed in order: {' -> '.join(self.state.completed_agents)}")
+            print(f"Agents executed in order: {' -> '.join(state.completed_agents)}")
+
+            # STEP 4: Evaluate the whole pipeline at once
+            executed = [agent for agent in JITPlanner.AGENTS if agent in outputs]
+            evaluations = AgentEvaluator.evaluate_batch(
+                [agent.__name__ for agent in executed],
+                [len(outputs[agent]) for agent in executed]
+            )
+            for evaluation in evaluations:
+                self.observability.log_evaluation(evaluation)
 
-            # STEP 7: Structure and return results
-            results = {
+            # STEP 5: Structure and return results
+            results = TripResult({
+                "request_id": req_id,
                 "destination": destination,
                 "preferences": preferences,
-                "response": f"\n\n".join([
-                    agent1_output,
-                    agent2_output,
-                    agent3_output,
-                    agent4_output,
-                    agent5_output
-                ]),
-                "state": self.state.to_dict(),
-                "pipeline_sequence": self.state.completed_agents,
-                "traces": self.observability.traces,
-                "evaluations": self.observability.evaluations
-            }
-
-            # Export observability data
-            self.observability.export_traces("trip_traces.json")
-            self.observability.export_evaluations("trip_evaluations.json")
-
-            print(f"\nTraces exported to: trip_traces.json")
-            print(f"Evaluations exported to: trip_evaluations.json")
-
+                "response": list(state.iter_outputs()),
+                "state": state.to_dict(),
+                "pipeline_sequence": state.completed_agents,
+                "execution_plan": [[agent.__name__ for agent in wave] for wave in plan],
+                "traces": self.observability.traces.select(req_id),
+                "evaluations": evaluations
+            })
+
+            # Append this request's records to the shared JSON-lines logs; every
+            # line carries req_id, so concurrent requests interleave safely
+            self.observability.flush()
+            self.observability.append_traces("trip_traces.jsonl", results["traces"])
+            self.observability.append_evaluations("trip_evaluations.jsonl", evaluations)
+
+            print(f"\nTraces appended to: trip_traces.jsonl (req_id {req_id})")
+            print(f"Evaluations appended to: trip_evaluations.jsonl (req_id {req_id})")
+
+            # Most recent completed run, kept for callers that inspect planner.state
+            self.state = state
             return results
 
         except Exception as e:
@@ -648,38 +1185,52 @@ class SequentialTripPlanner:
 # AGENT EVALUATOR
 # =====================================================================
 
+def _score_batch(output_lengths: Sequence[int]) -> Tuple[List[float], List[float]]:
+    """Column-wise (quality, completion) scores for a batch of agent outputs"""
+    quality = [0.8 if n > 300 else 0.5 for n in output_lengths]
+    completion = [1.0 if n > 200 else 0.7 for n in output_lengths]
+    return quality, completion
+
+
 class AgentEvaluator:
     """Evaluates agent performance"""
 
+    @staticmethod
+    def evaluate_batch(agent_names: Sequence[str], output_lengths: Sequence[int]) -> List[AgentEvaluation]:
+        """Evaluate a whole pipeline's agents in one scoring pass"""
+        quality, completion = _score_batch(output_lengths)
+
+        return [
+            AgentEvaluation(
+                agent_name=agent_name,
+                task_completion_rate=completion_rate,
+                information_quality=quality_score,
+                response_time_ms=1200,
+                tool_effectiveness=0.85,
+                state_consistency=True
+            )
+            for agent_name, quality_score, completion_rate in zip(agent_names, quality, completion)
+        ]
+
     @staticmethod
     def evaluate_agent(agent_name: str, output: str) -> AgentEvaluation:
         """Generic agent evaluation"""
-        quality_score = 0.8 if len(output) > 300 else 0.5
-        completion = 1.0 if len(output) > 200 else 0.7
-
-        return AgentEvaluation(
-            agent_name=agent_name,
-            task_completion_rate=completion,
-            information_quality=quality_score,
-            response_time_ms=1200,
-            tool_effectiveness=0.85,
-            state_consistency=True
-        )
+        return AgentEvaluator.evaluate_batch([agent_name], [len(output)])[0]
 
 
 # =====================================================================
-# MAIN EXECUTION (SYNCHRONOUS)
+# MAIN EXECUTION
 # =====================================================================
 
 def main():
-    """Main execution - SYNCHRONOUS (no asyncio.run needed)"""
+    """Main execution - plan_trip drives the async pipeline via asyncio.run"""
 
     print("\n" + "=" * 70)
-    print("Sequential Trip Planning System - SYNCHRONOUS")
+    print("Sequential Trip Planning System - ASYNC")
     print("=" * 70)
     print("Architecture: Sequential Agent Chain (day-1b patterns)")
-    print("Execution: Pure Synchronous (No async/await/runner)")
-    print("Pattern: Agent1 -> Agent2 -> Agent3 -> Agent4 -> Agent5")
+    print("Execution: asyncio (independent agents run concurrently)")
+    print("Pattern: Agent1 -> (Agent2 || Agent3) -> Agent4 -> Agent5")
     print("=" * 70)
 
     # Create planner
@@ -695,7 +1246,7 @@ def main():
         "start_date": "2024-06-01"
     }
 
-    # Execute trip planning SYNCHRONOUSLY
+    # Execute trip planning (sync wrapper around plan_trip_async)
     results = planner.plan_trip("Tokyo, Japan", preferences)
 
     print("\n✅ Trip planning complete!")
@@ -714,12 +1265,12 @@ def main():
 import json
 from pprint import pprint
 if __name__ == "__main__":
-    # Execute synchronously - no asyncio needed!
+    # plan_trip runs the async pipeline to completion
     result = main()
 
     print("\n" + "=" * 70)
-    print("System ready. Synchronous sequential agents completed.")
+    print("System ready. Sequential agents completed.")
     print("=" * 70)
 
     # print(json.dumps(result, indent=2, ensure_ascii=False, sort_keys=True))
-    pprint(result["response"], width=120)
\ No newline at end of file
+    pprint(result.response_text, width=120)
\ No newline at end of file